@@ -8,26 +8,174 @@ import re
 import sys
 import os
 import argparse
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Dict, Set, Optional, Tuple
+import configparser
+import hashlib
+import importlib.machinery
+import importlib.util
+import itertools
+import json
+import mmap
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, ClassVar, List, Dict, Set, Optional, Tuple, Iterator, Iterable, TextIO, NamedTuple, Union, Pattern, Match
 
-class LintLevel(Enum):
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    INFO = "INFO"
+# Rule patterns, compiled once at import time. They are run over the whole
+# file, so they use [^\S\n] (whitespace other than a newline) to make sure
+# no match spans more than one line. They are also written so that the
+# backtracking engine stays linear on long lines: no two adjacent
+# quantifiers can trade the same characters, the raw-pointer pattern only
+# starts at word boundaries, and the function pattern stops at the opening
+# parenthesis (see _untyped_functions for the rest of that rule)
+_LET_CONST_RE = re.compile(rb'(let|const)[^\S\n]+(\w+)[^\S\n]*(:[^\S\n]*\w+[^\S\n]*)?=')
+_DECL_NAME_RE = re.compile(rb'(let|const)[^\S\n]+(\w+)')
+_FUNC_DECL_RE = re.compile(rb'function[^\S\n]+(\w+)[^\S\n]*\(')
+_RAW_PTR_RE = re.compile(rb'\b\w+[^\S\n]*:[^\S\n]*\w+@(?!unsafe|aligned)')
+_MEM_ATTR_RE = re.compile(rb'#(?:stack|heap|static)\b')
 
-@dataclass
-class LintMessage:
+# Every byte except braces and parentheses, for stripping a file down to
+# just the characters _check_content counts
+_NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b'{}()')
+
+# Value types of the configuration options TSPPLinter understands
+_INT_OPTIONS = ("max_line_length", "indent_size")
+_BOOL_OPTIONS = ("require_semicolons", "enforce_types", "recommend_memory_attrs")
+_LIST_OPTIONS = ("ignored_rules",)
+
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 1 << 20
+# Size of the pieces a mapped file is copied out in when bytes methods
+# that mmap lacks are needed
+_CHUNK_SIZE = 1 << 20
+
+# Most cache entries kept; the least recently used ones are pruned beyond it
+_CACHE_MAX_ENTRIES = 5000
+
+# File content as linted: bytes for small files, a read-only map for large ones
+Source = Union[bytes, mmap.mmap]
+
+
+def default_cache_dir() -> str:
+    """Directory used for cached lint results when --cache is given"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'tspp-linter')
+
+
+def _decode(data: bytes) -> str:
+    """Decode source bytes for use in a message"""
+    return data.decode('utf-8', 'replace')
+
+
+def _column(content: Source, offset: int, line_start: int) -> int:
+    """Convert a byte offset to a 1-based character column on its line"""
+    return len(_decode(content[line_start:offset])) + 1
+
+
+def _split_lines(content: Source) -> Iterable[bytes]:
+    """Split file content into lines, without their trailing newline.
+
+    A mapped file is split lazily so that only one line at a time is
+    copied out of the map.
+    """
+    if isinstance(content, bytes):
+        return content.split(b'\n')
+    return _iter_mapped_lines(content)
+
+
+def _iter_mapped_lines(content: mmap.mmap) -> Iterator[bytes]:
+    """Yield the lines of a mapped file one at a time"""
+    start = 0
+    while True:
+        end = content.find(b'\n', start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def _first_match_per_line(pattern: Pattern[bytes], content: Source,
+                           line_starts: List[int]) -> Iterator[Tuple[int, Match[bytes]]]:
+    """Yield (line index, match) for the leftmost match of a pattern on each line"""
+    last_index = -1
+    for match in pattern.finditer(content):
+        index = bisect_right(line_starts, match.start()) - 1
+        if index != last_index:
+            last_index = index
+            yield index, match
+
+
+def _untyped_functions(content: Source,
+                       line_starts: List[int]) -> Iterator[Tuple[int, Match[bytes]]]:
+    """Yield (line index, match) for the leftmost function declaration on each
+    line whose closing parenthesis is not followed by a ':' return type.
+
+    The closing parenthesis is found with find() rather than by the pattern,
+    and is remembered between declarations, so a line full of unclosed
+    declarations is scanned once instead of once per declaration.
+    """
+    last_index = -1
+    close = -1
+    for match in _FUNC_DECL_RE.finditer(content):
+        index = bisect_right(line_starts, match.start()) - 1
+        if index == last_index:
+            continue
+        if close < match.end():
+            close = content.find(b')', match.end(), line_starts[index + 1] - 1)
+            if close < 0:
+                # No later declaration on this line can be closed either
+                last_index = index
+                continue
+        if content[close + 1:close + 2] != b':':
+            last_index = index
+            yield index, match
+
+
+def _count_brackets(content: Source) -> Tuple[int, int, int, int]:
+    """Count the '{', '}', '(' and ')' bytes of the content.
+
+    Each piece of the content is stripped down to its brackets with one
+    C-level translate() pass, and only that small residue is counted.
+    Mapped files lack translate(), so they are copied out a chunk at a time;
+    bytes are handled as a single piece.
+    """
+    step = max(len(content), 1) if isinstance(content, bytes) else _CHUNK_SIZE
+
+    opening_braces = closing_braces = opening_parens = closing_parens = 0
+    for start in range(0, len(content), step):
+        brackets = content[start:start + step].translate(None, _NON_BRACKET_BYTES)
+        opening_braces += brackets.count(b'{')
+        closing_braces += brackets.count(b'}')
+        opening_parens += brackets.count(b'(')
+        closing_parens += brackets.count(b')')
+    return opening_braces, closing_braces, opening_parens, closing_parens
+
+class LintLevel:
+    """Message levels, kept as plain strings"""
+    ERROR: ClassVar[str] = "ERROR"
+    WARNING: ClassVar[str] = "WARNING"
+    INFO: ClassVar[str] = "INFO"
+
+class LineMap(NamedTuple):
+    """Per-line facts gathered by the line scan for the structural rules"""
+    # Offset of the first byte of every line, plus one past the end of the
+    # file, so line i spans starts[i] up to starts[i + 1] - 1
+    starts: List[int]
+    # Non-zero for lines that are comments
+    comments: bytearray
+    # Non-zero for lines inside an #unsafe block
+    unsafe: bytearray
+
+class LintMessage(NamedTuple):
     file: str
     line: int
     column: int
-    level: LintLevel
+    level: str
     code: str
     message: str
 
     def __str__(self) -> str:
-        return f"{self.file}:{self.line}:{self.column} - {self.level.value} {self.code}: {self.message}"
+        return f"{self.file}:{self.line}:{self.column} - {self.level} {self.code}: {self.message}"
 
 class TSPPLinter:
     """
@@ -35,7 +183,7 @@ class TSPPLinter:
     """
     
     # Rules with codes and descriptions
-    RULES = {
+    RULES: ClassVar[Dict[str, str]] = {
         # Syntax rules
         "E001": "Missing semicolon",
         "E002": "Unmatched curly brace",
@@ -64,12 +212,13 @@ class TSPPLinter:
         "I004": "Consider stack allocation for small objects",
     }
 
-    def __init__(self, config=None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, cache_dir: Optional[str] = None) -> None:
         self.config = config or {}
-        self.messages = []
+        self.messages: List[LintMessage] = []
+        self.cache_dir = cache_dir
         
         # Set default options
-        self.options = {
+        self.options: Dict[str, Any] = {
             "max_line_length": self.config.get("max_line_length", 100),
             "indent_size": self.config.get("indent_size", 4),
             "require_semicolons": self.config.get("require_semicolons", True),
@@ -78,67 +227,149 @@ class TSPPLinter:
             "ignored_rules": set(self.config.get("ignored_rules", [])),
         }
 
+        # Cached results are only valid for the same linter code and options
+        self._cache_tag: Optional[str] = None
+        if self.cache_dir:
+            with open(__file__, 'rb') as f:
+                fingerprint = hashlib.sha1(f.read())
+            fingerprint.update(json.dumps(self.options, sort_keys=True, default=sorted).encode())
+            self._cache_tag = fingerprint.hexdigest()[:16]
+
     def lint_file(self, filename: str) -> List[LintMessage]:
         """Lint a single TSPP file"""
         if not filename.endswith(".tspp"):
             raise ValueError(f"Not a TSPP file: {filename}")
 
-        with open(filename, 'r') as f:
-            content = f.read()
-            
+        # Work on raw bytes; only the parts quoted in messages get decoded.
+        # Large files are memory-mapped so the OS pages them in on demand
+        # rather than the whole file being copied up front
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                content: Source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = f.read()
+
+        try:
+            return self._lint_content(filename, content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    def _lint_content(self, filename: str, content: Source) -> List[LintMessage]:
+        """Lint the already loaded content of a TSPP file"""
+        # Unchanged files are answered from the cache without being linted
+        cache_path = None
+        if self.cache_dir:
+            digest = hashlib.sha1(content).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f"{digest}-{self._cache_tag}.json")
+            cached = self._load_cached(filename, cache_path)
+            if cached is not None:
+                self.messages = cached
+                return self.messages
+
         self.messages = []
         
-        # Split into lines for line-by-line analysis
-        lines = content.splitlines()
-        
-        # Pass 1: Perform line-based checks
-        for i, line in enumerate(lines):
-            line_num = i + 1
-            self._check_line(filename, line_num, line)
-            
-        # Pass 2: Perform content-based checks
+        # Pass 1: Perform content-based checks
         self._check_content(filename, content)
         
-        # Pass 3: Perform structural checks
-        self._check_structure(filename, content, lines)
+        # Pass 2: Perform line-based checks, mapping out the lines on the way
+        line_map = self._scan_lines(filename, _split_lines(content))
+
+        # Pass 3: Perform structural checks, one pattern search over the whole
+        # file per rule
+        self._check_structure(filename, content, line_map)
+
+        # The structural rules report one rule at a time; put the messages
+        # back in line order. The sort is stable, so ties keep rule order
+        self.messages.sort(key=lambda msg: (msg.line, msg.column))
+
+        if cache_path:
+            self._store_cached(cache_path)
 
         return self.messages
 
-    def _check_line(self, filename: str, line_num: int, line: str) -> None:
-        """Check a single line for simple linting issues"""
-        # Check line length
-        if len(line.rstrip()) > self.options["max_line_length"] and "W002" not in self.options["ignored_rules"]:
-            self.messages.append(LintMessage(
-                file=filename,
-                line=line_num, 
-                column=self.options["max_line_length"] + 1,
-                level=LintLevel.WARNING,
-                code="W002",
-                message=f"Line too long ({len(line.rstrip())} > {self.options['max_line_length']})"
-            ))
-            
-        # Check indentation - skip this for now since it's being too aggressive
-        return
-        
-        # Check for missing semicolons - skip for now
-        pass
+    def _load_cached(self, filename: str, cache_path: str) -> Optional[List[LintMessage]]:
+        """Return the cached messages for a file, or None on a cache miss"""
+        try:
+            with open(cache_path, 'r') as f:
+                entries = json.load(f)
+            messages = [LintMessage(filename, line, column, level, code, message)
+                        for line, column, level, code, message in entries]
+        except (OSError, TypeError, ValueError):
+            # Missing, unreadable or malformed entries just mean a fresh lint
+            return None
+
+        # Mark the entry as recently used so pruning keeps it
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return messages
+
+    def _store_cached(self, cache_path: str) -> None:
+        """Save the current messages; the file name is not part of the entry"""
+        entries = [[msg.line, msg.column, msg.level, msg.code, msg.message]
+                   for msg in self.messages]
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent workers never
+            # see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        except OSError:
+            # A cache that can't be written only costs speed, not results
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Don't leave the partial entry behind; pruning only sees .json
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-    def _check_content(self, filename: str, content: str) -> None:
+    def prune_cache(self) -> None:
+        """Bound the size of the cache directory.
+
+        Only the _CACHE_MAX_ENTRIES most recently used entries are kept,
+        whatever configuration they were written for: runs with different
+        options share the directory, and each still hits its own entries.
+        """
+        if not self.cache_dir:
+            return
+        # Pruning is housekeeping, so errors (including entries removed by a
+        # concurrent run) are ignored rather than failing the lint run
+        used = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        try:
+                            used.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            pass
+        except OSError:
+            return
+        used.sort(reverse=True)
+        for _, path in used[_CACHE_MAX_ENTRIES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _check_content(self, filename: str, content: Source) -> None:
         """Check the file content for various issues"""
+        check_braces = "E002" not in self.options["ignored_rules"]
+        check_parens = "E003" not in self.options["ignored_rules"]
+        if not (check_braces or check_parens):
+            return
+
+        opening_braces, closing_braces, opening_parens, closing_parens = _count_brackets(content)
+
         # Check for unmatched braces
-        opening_braces = content.count('{')
-        closing_braces = content.count('}')
-        
-        if opening_braces > closing_braces and "E002" not in self.options["ignored_rules"]:
-            self.messages.append(LintMessage(
-                file=filename,
-                line=1,
-                column=1,
-                level=LintLevel.ERROR,
-                code="E002",
-                message=f"Unmatched curly braces: {opening_braces} opening, {closing_braces} closing"
-            ))
-        elif opening_braces < closing_braces and "E002" not in self.options["ignored_rules"]:
+        if opening_braces != closing_braces and check_braces:
             self.messages.append(LintMessage(
                 file=filename,
                 line=1,
@@ -149,19 +380,7 @@ class TSPPLinter:
             ))
             
         # Check for unmatched parentheses
-        opening_parens = content.count('(')
-        closing_parens = content.count(')')
-        
-        if opening_parens > closing_parens and "E003" not in self.options["ignored_rules"]:
-            self.messages.append(LintMessage(
-                file=filename,
-                line=1,
-                column=1,
-                level=LintLevel.ERROR,
-                code="E003",
-                message=f"Unmatched parentheses: {opening_parens} opening, {closing_parens} closing"
-            ))
-        elif opening_parens < closing_parens and "E003" not in self.options["ignored_rules"]:
+        if opening_parens != closing_parens and check_parens:
             self.messages.append(LintMessage(
                 file=filename,
                 line=1,
@@ -171,208 +390,331 @@ class TSPPLinter:
                 message=f"Unmatched parentheses: {opening_parens} opening, {closing_parens} closing"
             ))
 
-    def _check_structure(self, filename: str, content: str, lines: List[str]) -> None:
+    def _scan_lines(self, filename: str, lines: Iterable[bytes]) -> LineMap:
+        """Check each line on its own and record where lines start, which
+        are comments and which are inside #unsafe blocks"""
+        max_line_length = self.options["max_line_length"]
+        check_length = "W002" not in self.options["ignored_rules"]
+
+        starts = []
+        comments = bytearray()
+        unsafe = bytearray()
+        offset = 0
+        unsafe_block = False
+        for i, line in enumerate(lines):
+            starts.append(offset)
+            offset += len(line) + 1
+
+            # Lines without a '/' can't be comments
+            is_comment = b'/' in line and line.lstrip().startswith((b'//', b'/*'))
+            comments.append(is_comment)
+
+            # Track whether we're in an unsafe block: it starts at an #unsafe
+            # line and ends at a line that closes a block before opening one.
+            # Commented-out code neither opens nor closes a block
+            if b'#unsafe' in line and not is_comment:
+                unsafe_block = True
+            elif unsafe_block and not is_comment:
+                close = line.find(b'}')
+                if close >= 0 and line.find(b'{', 0, close) < 0:
+                    unsafe_block = False
+            unsafe.append(unsafe_block)
+
+            # Check line length. The raw byte length is an upper bound on the
+            # stripped character length, so most lines are settled without
+            # stripping or decoding anything
+            if check_length and len(line) > max_line_length:
+                length = len(_decode(line.rstrip()))
+                if length > max_line_length:
+                    self.messages.append(LintMessage(
+                        file=filename,
+                        line=i + 1, 
+                        column=max_line_length + 1,
+                        level=LintLevel.WARNING,
+                        code="W002",
+                        message=f"Line too long ({length} > {max_line_length})"
+                    ))
+
+        starts.append(offset)
+        return LineMap(starts, comments, unsafe)
+
+    def _check_structure(self, filename: str, content: Source, line_map: LineMap) -> None:
         """Check structural aspects of the code"""
+        # Which rules run is fixed by the options, so settle it once per file.
+        # Disabled rules skip their pattern search entirely
+        ignored = self.options["ignored_rules"]
+        starts, comments, unsafe = line_map
+
         # Check for variable declarations without type annotations
-        for i, line in enumerate(lines):
-            # Skip comments
-            if line.strip().startswith('//') or line.strip().startswith('/*'):
-                continue
-                
-            # Look for let/const declarations without a type annotation
-            # This is a simpler but more reliable method
-            if re.search(r'(let|const)\s+\w+\s*=', line) and not re.search(r'(let|const)\s+\w+\s*:\s*\w+', line):
-                match = re.search(r'(let|const)\s+(\w+)', line)
-                if match and self.options["enforce_types"] and "E005" not in self.options["ignored_rules"]:
+        if self.options["enforce_types"] and "E005" not in ignored:
+            # Report the first untyped declaration on each line, whatever
+            # typed declarations come before it
+            reported_index = -1
+            for match in _LET_CONST_RE.finditer(content):
+                if match.group(3) is not None:
+                    continue
+                index = bisect_right(starts, match.start()) - 1
+                if index != reported_index and not comments[index]:
+                    reported_index = index
                     self.messages.append(LintMessage(
                         file=filename,
-                        line=i + 1,
-                        column=match.start() + 1,
+                        line=index + 1,
+                        column=_column(content, match.start(), starts[index]),
                         level=LintLevel.ERROR,
                         code="E005",
-                        message=f"Missing type annotation for variable '{match.group(2)}'"
+                        message=f"Missing type annotation for variable '{_decode(match.group(2))}'"
                     ))
 
         # Check for function declarations without return types
-        func_decl_pattern = re.compile(r'function\s+(\w+)\s*\([^)]*\)\s*(?!:)')
-        for i, line in enumerate(lines):
-            if line.strip().startswith('//') or line.strip().startswith('/*'):
-                continue
-                
-            match = func_decl_pattern.search(line)
-            if match and "W003" not in self.options["ignored_rules"]:
+        if "W003" not in ignored:
+            for index, match in _untyped_functions(content, starts):
+                if not comments[index]:
+                    self.messages.append(LintMessage(
+                        file=filename,
+                        line=index + 1,
+                        column=_column(content, match.start(), starts[index]),
+                        level=LintLevel.WARNING,
+                        code="W003",
+                        message=f"Missing return type for function '{_decode(match.group(1))}'"
+                    ))
+
+        # Check for raw pointers outside of unsafe blocks
+        if "W101" not in ignored:
+            suggest_smart_pointers = "I001" not in ignored
+            for match in _RAW_PTR_RE.finditer(content):
+                index = bisect_right(starts, match.start()) - 1
+                if comments[index] or unsafe[index]:
+                    continue
+
+                column = _column(content, match.start(), starts[index])
                 self.messages.append(LintMessage(
                     file=filename,
-                    line=i + 1,
-                    column=match.start() + 1,
+                    line=index + 1,
+                    column=column,
                     level=LintLevel.WARNING,
-                    code="W003",
-                    message=f"Missing return type for function '{match.group(1)}'"
+                    code="W101",
+                    message="Raw pointer used outside unsafe block"
                 ))
-                
-        # Check for raw pointers outside of unsafe blocks
-        raw_ptr_pattern = re.compile(r'\w+\s*:\s*\w+@(?!unsafe|aligned)')
-        for i, line in enumerate(lines):
-            if line.strip().startswith('//') or line.strip().startswith('/*'):
-                continue
-                
-            matches = raw_ptr_pattern.finditer(line)
-            for match in matches:
-                unsafe_block = False
-                # Check if we're in an unsafe block by looking backwards
-                for j in range(i, -1, -1):
-                    if "#unsafe" in lines[j]:
-                        unsafe_block = True
-                        break
-                    elif "}" in lines[j] and "{" not in lines[j][:lines[j].index("}")]:
-                        # We've exited a block, stop checking
-                        break
-                
-                if not unsafe_block and "W101" not in self.options["ignored_rules"]:
+
+                # Also suggest smart pointers
+                if suggest_smart_pointers:
                     self.messages.append(LintMessage(
                         file=filename,
-                        line=i + 1,
-                        column=match.start() + 1,
-                        level=LintLevel.WARNING,
-                        code="W101",
-                        message="Raw pointer used outside unsafe block"
+                        line=index + 1,
+                        column=column,
+                        level=LintLevel.INFO,
+                        code="I001",
+                        message="Consider using smart pointers (#shared<T> or #unique<T>) instead of raw pointers"
                     ))
-                    
-                    # Also suggest smart pointers
-                    if "I001" not in self.options["ignored_rules"]:
-                        self.messages.append(LintMessage(
-                            file=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            level=LintLevel.INFO,
-                            code="I001",
-                            message="Consider using smart pointers (#shared<T> or #unique<T>) instead of raw pointers"
-                        ))
-                        
-        # Check for missing memory placement attributes in variable declarations
-        if self.options["recommend_memory_attrs"]:
-            # Check if line has memory directive
-            for i, line in enumerate(lines):
-                if line.strip().startswith('//') or line.strip().startswith('/*'):
-                    continue
-                
-                # Skip lines that already have memory directives
-                if any(directive in line for directive in ['#stack', '#heap', '#static']):
+
+        # Check for missing memory placement attributes in declarations
+        # with arrays or the new keyword, skipping lines that already
+        # have a memory directive
+        if self.options["recommend_memory_attrs"] and "W104" not in ignored:
+            for index, match in _first_match_per_line(_DECL_NAME_RE, content, starts):
+                if comments[index]:
                     continue
-                
-                # Check for variable declarations with arrays or new keyword
-                if ("new " in line or ("[" in line and "]" in line)) and ("let " in line or "const " in line):
-                    match = re.search(r'(let|const)\s+(\w+)', line)
-                    if match and "W104" not in self.options["ignored_rules"]:
-                        self.messages.append(LintMessage(
-                            file=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            level=LintLevel.WARNING,
-                            code="W104",
-                            message=f"Missing memory placement attribute for variable '{match.group(2)}'"
-                        ))
-
-def parse_config(config_file: str) -> Dict:
+                line = content[starts[index]:starts[index + 1] - 1]
+                if ((b"let " in line or b"const " in line)
+                        and (b"new " in line or (b"[" in line and b"]" in line))
+                        and not (b'#' in line and _MEM_ATTR_RE.search(line))):
+                    self.messages.append(LintMessage(
+                        file=filename,
+                        line=index + 1,
+                        column=_column(content, match.start(), starts[index]),
+                        level=LintLevel.WARNING,
+                        code="W104",
+                        message=f"Missing memory placement attribute for variable '{_decode(match.group(2))}'"
+                    ))
+
+# Linter owned by the current worker process, created once by _init_worker
+_worker_linter: Optional[TSPPLinter] = None
+
+def _init_worker(config: Dict[str, Any], cache_dir: Optional[str] = None) -> None:
+    """Create the per-process linter used by _lint_one"""
+    global _worker_linter
+    _worker_linter = TSPPLinter(config, cache_dir)
+
+def _lint_one(filename: str) -> List[LintMessage]:
+    """Lint one file with this process's linter, reporting failures to stderr"""
+    assert _worker_linter is not None, "_init_worker has not been called"
+    try:
+        return _worker_linter.lint_file(filename)
+    except Exception as e:
+        print(f"Error linting {filename}: {e}", file=sys.stderr)
+        return []
+
+def _iter_tspp_files(root: str) -> Iterator[str]:
+    """Yield the paths of all .tspp files below a directory.
+
+    Uses os.scandir directly so the file type comes from the directory
+    entry itself instead of an extra stat call per entry.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        # Unreadable directories are skipped, as os.walk would do
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_tspp_files(entry.path)
+            elif entry.name.endswith('.tspp') and entry.is_file():
+                yield entry.path
+
+def parse_config(config_file: str) -> Dict[str, Any]:
     """Parse a linter configuration file"""
     if not os.path.exists(config_file):
         return {}
-        
-    config = {}
+
+    # The file is a flat list of 'key = value' lines, so read it as the body
+    # of a single section. Lines are stripped first so indented keys aren't
+    # taken as continuations of the previous value
+    parser = configparser.ConfigParser(delimiters=('=',), comment_prefixes=('#',),
+                                       allow_no_value=True, strict=False, interpolation=None)
     with open(config_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Handle list values
-                if value.startswith('[') and value.endswith(']'):
-                    value = [item.strip() for item in value[1:-1].split(',') if item.strip()]
-                    
-                # Handle boolean values
-                elif value.lower() in ('true', 'yes', 'on'):
-                    value = True
-                elif value.lower() in ('false', 'no', 'off'):
-                    value = False
-                # Handle integer values
-                elif value.isdigit():
-                    value = int(value)
-                    
-                config[key] = value
+        parser.read_file(itertools.chain(['[linter]'], (line.strip() for line in f)), source=config_file)
+    # A '[...]' line would otherwise open a new section whose keys are
+    # silently ignored
+    extra_sections = [name for name in parser.sections() if name != 'linter']
+    if extra_sections:
+        raise configparser.Error(f"unexpected section header [{extra_sections[0]}]; "
+                                 "the file is a flat list of 'key = value' lines")
+    section = parser['linter']
+
+    config: Dict[str, Any] = {}
+    for key, value in section.items():
+        if value is None:
+            continue
+        if key in _INT_OPTIONS:
+            config[key] = section.getint(key)
+        elif key in _BOOL_OPTIONS:
+            config[key] = section.getboolean(key)
+        elif key in _LIST_OPTIONS:
+            # Lists are written as [A, B]; the brackets are optional
+            if value.startswith('[') and value.endswith(']'):
+                value = value[1:-1]
+            config[key] = [item.strip() for item in value.split(',') if item.strip()]
+        else:
+            config[key] = value
                 
     return config
 
-def format_messages(messages: List[LintMessage], format_type: str) -> str:
-    """Format the lint messages in various output formats"""
+def format_messages(messages: List[LintMessage], out: TextIO, format_type: str) -> None:
+    """Write the lint messages to a stream in various output formats.
+
+    Messages are written one at a time so the report is never built up
+    as a single string.
+    """
+    write = out.write
     if format_type == 'text':
-        return '\n'.join(str(msg) for msg in messages)
+        for msg in messages:
+            write(str(msg))
+            write('\n')
     elif format_type == 'json':
-        import json
-        return json.dumps([{
-            'file': msg.file,
-            'line': msg.line,
-            'column': msg.column,
-            'level': msg.level.value,
-            'code': msg.code,
-            'message': msg.message
-        } for msg in messages], indent=2)
+        # Same layout as json.dump(..., indent=2) on the whole list
+        first = True
+        for msg in messages:
+            write('[\n  ' if first else ',\n  ')
+            first = False
+            write(json.dumps({
+                'file': msg.file,
+                'line': msg.line,
+                'column': msg.column,
+                'level': msg.level,
+                'code': msg.code,
+                'message': msg.message
+            }, indent=2).replace('\n', '\n  '))
+        write('[]\n' if first else '\n]\n')
     else:
         raise ValueError(f"Unknown format type: {format_type}")
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(description='TSPP Linter - A static analysis tool for TypeScript++ files')
     parser.add_argument('files', nargs='+', help='Files or directories to lint')
     parser.add_argument('--config', help='Configuration file path')
     parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
     parser.add_argument('--ignore', nargs='+', help='Rules to ignore (e.g., E001 W002)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of files to lint in parallel (default: CPU count)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Reuse results for unchanged files (stored in {default_cache_dir()})')
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
     
     # Load configuration
     config = {}
     if args.config:
-        config = parse_config(args.config)
+        try:
+            config = parse_config(args.config)
+        except (configparser.Error, ValueError) as e:
+            parser.error(f"invalid configuration file {args.config}: {e}")
         
     # Add command line ignores to config
     if args.ignore:
         config['ignored_rules'] = list(set(config.get('ignored_rules', []) + args.ignore))
         
-    # Initialize linter
-    linter = TSPPLinter(config)
-    
     # Collect all files to lint
-    all_files = []
+    all_files: List[str] = []
     for file_path in args.files:
         if os.path.isdir(file_path):
-            for root, _, files in os.walk(file_path):
-                for file in files:
-                    if file.endswith('.tspp'):
-                        all_files.append(os.path.join(root, file))
+            all_files.extend(_iter_tspp_files(file_path))
         elif os.path.isfile(file_path) and file_path.endswith('.tspp'):
             all_files.append(file_path)
+
+    # Lint in file name order. Each file's messages come back sorted by line
+    # and column, so the combined report needs no sort of its own
+    all_files.sort()
     
-    # Lint all files
+    # Lint all files. Files are independent, so spread them over worker
+    # processes unless there is nothing to gain from the pool start-up cost
     all_messages = []
-    for file in all_files:
-        try:
-            messages = linter.lint_file(file)
-            all_messages.extend(messages)
-        except Exception as e:
-            print(f"Error linting {file}: {e}", file=sys.stderr)
-    
-    # Sort messages by file, line, column
-    all_messages.sort(key=lambda msg: (msg.file, msg.line, msg.column))
+    cache_dir = default_cache_dir() if args.cache else None
+    jobs = min(args.jobs, len(all_files))
+    if jobs > 1:
+        chunksize = max(1, len(all_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(config, cache_dir)) as executor:
+            for messages in executor.map(_lint_one, all_files, chunksize=chunksize):
+                all_messages.extend(messages)
+    else:
+        _init_worker(config, cache_dir)
+        for file in all_files:
+            all_messages.extend(_lint_one(file))
     
     # Output results
-    print(format_messages(all_messages, args.format))
+    format_messages(all_messages, sys.stdout, args.format)
+
+    if cache_dir:
+        TSPPLinter(config, cache_dir).prune_cache()
     
     # Return error code if any errors found
     if any(msg.level == LintLevel.ERROR for msg in all_messages):
         sys.exit(1)
     
+def _compiled_main() -> Optional[Callable[[], None]]:
+    """Return main() from a mypyc-compiled build of this module, if one
+    has been built next to the script"""
+    spec = importlib.util.find_spec('tspp_linter')
+    if (spec is None or spec.origin is None
+            or not isinstance(spec.loader, importlib.machinery.ExtensionFileLoader)):
+        return None
+    # The build is not under source control, so after a pull or a local
+    # edit it would silently keep running the old rules
+    if os.path.getmtime(spec.origin) < os.path.getmtime(__file__):
+        print(f"Warning: ignoring {spec.origin}, which is older than {__file__}; "
+              f"rebuild or delete it", file=sys.stderr)
+        return None
+    try:
+        module = importlib.import_module('tspp_linter')
+        compiled: Callable[[], None] = module.main
+    except Exception as e:
+        # A broken build (e.g. from a mypyc release that can't handle this
+        # module) must not stop the linter from running
+        print(f"Warning: ignoring {spec.origin}, which failed to import: {e!r}",
+              file=sys.stderr)
+        return None
+    return compiled
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    (_compiled_main() or main)()
\ No newline at end of file